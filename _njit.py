@@ -0,0 +1,17 @@
+"""Optional numba acceleration.
+
+numba is deliberately not a hard dependency: when it is installed the
+decorated kernels are JIT-compiled, otherwise they run as plain Python
+over NumPy arrays, which is still fast enough for a 10-coin batch.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
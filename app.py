@@ -1,617 +1,832 @@
-
-from flask import Flask, render_template_string, request, jsonify
-import requests
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-import time
-import threading
-import warnings
-import logging
-import os
-
-warnings.filterwarnings('ignore')
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)s %(message)s',
-    handlers=[logging.StreamHandler()]
-)
-
-app = Flask(__name__)
-
-class ReliableCryptoAnalyzer:
-    def __init__(self):
-        self.coins = ['BTC', 'ETH', 'ADA', 'SOL', 'DOT', 'MATIC', 'BNB', 'XRP', 'DOGE', 'AVAX']
-        self.cache_duration = 30
-        self.data_cache = {}
-        self.cache_lock = threading.Lock()
-        
-        # CoinGecko API endpoint for simple price data
-        self.base_url = "https://api.coingecko.com/api/v3"
-        
-    def get_all_prices(self):
-        """Get all prices in one API call - more reliable"""
-        cache_key = "all_prices"
-        
-        with self.cache_lock:
-            if cache_key in self.data_cache:
-                cached_data, timestamp = self.data_cache[cache_key]
-                if (datetime.now() - timestamp).seconds < self.cache_duration:
-                    return cached_data
-                else:
-                    del self.data_cache[cache_key]
-        
-        try:
-            # Use the simple price endpoint that works better
-            coin_ids = ['bitcoin', 'ethereum', 'cardano', 'solana', 'polkadot', 
-                       'matic-network', 'binancecoin', 'ripple', 'dogecoin', 'avalanche-2']
-            
-            url = f"{self.base_url}/simple/price"
-            params = {
-                'ids': ','.join(coin_ids),
-                'vs_currencies': 'usd',
-                'include_24hr_change': 'true',
-                'include_24hr_vol': 'true',
-                'include_last_updated_at': 'true'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                result = {}
-                
-                # Map coin IDs to our symbols
-                coin_mapping = {
-                    'bitcoin': 'BTC', 'ethereum': 'ETH', 'cardano': 'ADA', 
-                    'solana': 'SOL', 'polkadot': 'DOT', 'matic-network': 'MATIC',
-                    'binancecoin': 'BNB', 'ripple': 'XRP', 'dogecoin': 'DOGE', 
-                    'avalanche-2': 'AVAX'
-                }
-                
-                for coin_id, coin_data in data.items():
-                    symbol = coin_mapping.get(coin_id)
-                    if symbol:
-                        result[symbol] = {
-                            'price': coin_data.get('usd', 0),
-                            'price_change_24h': coin_data.get('usd_24h_change', 0),
-                            'volume': coin_data.get('usd_24h_vol', 0),
-                            'last_updated': coin_data.get('last_updated_at', 0),
-                            'source': 'coingecko'
-                        }
-                
-                # Fill any missing coins with fallback
-                for symbol in self.coins:
-                    if symbol not in result:
-                        result[symbol] = self._get_fallback_data(symbol)
-                
-                with self.cache_lock:
-                    self.data_cache[cache_key] = (result, datetime.now())
-                
-                logging.info(f"✅ Successfully fetched live data for {len(result)} coins")
-                return result
-            else:
-                logging.warning(f"CoinGecko API error: {response.status_code}")
-                return self._get_all_fallback_data()
-                
-        except Exception as e:
-            logging.error(f"Error fetching data from CoinGecko: {e}")
-            return self._get_all_fallback_data()
-    
-    def _get_all_fallback_data(self):
-        """Fallback data when API fails"""
-        fallback_prices = {
-            'BTC': 43450, 'ETH': 2350, 'ADA': 0.48, 'SOL': 102,
-            'DOT': 6.85, 'MATIC': 0.78, 'BNB': 315, 'XRP': 0.57,
-            'DOGE': 0.085, 'AVAX': 36.5
-        }
-        
-        result = {}
-        for symbol, price in fallback_prices.items():
-            # Add some small random variation to fallback data
-            varied_price = price * (1 + np.random.uniform(-0.02, 0.02))
-            result[symbol] = {
-                'price': varied_price,
-                'price_change_24h': np.random.uniform(-5, 5),
-                'volume': 0,
-                'last_updated': datetime.now().timestamp(),
-                'source': 'fallback'
-            }
-        
-        logging.info("⚠️ Using fallback data (API unavailable)")
-        return result
-    
-    def _get_fallback_data(self, symbol):
-        """Individual fallback data"""
-        fallback_prices = {
-            'BTC': 43450, 'ETH': 2350, 'ADA': 0.48, 'SOL': 102,
-            'DOT': 6.85, 'MATIC': 0.78, 'BNB': 315, 'XRP': 0.57,
-            'DOGE': 0.085, 'AVAX': 36.5
-        }
-        
-        price = fallback_prices.get(symbol, 100)
-        varied_price = price * (1 + np.random.uniform(-0.02, 0.02))
-        
-        return {
-            'price': varied_price,
-            'price_change_24h': np.random.uniform(-5, 5),
-            'volume': 0,
-            'last_updated': datetime.now().timestamp(),
-            'source': 'fallback'
-        }
-    
-    def force_refresh_all_data(self):
-        """Force refresh all cached data"""
-        with self.cache_lock:
-            self.data_cache.clear()
-        logging.info("🔄 All data cache cleared - forcing refresh")
-    
-    def generate_trading_signals(self, symbol):
-        """Generate trading signals based on reliable data"""
-        try:
-            all_data = self.get_all_prices()
-            market_data = all_data.get(symbol, self._get_fallback_data(symbol))
-            
-            current_price = market_data['price']
-            price_change_24h = market_data['price_change_24h']
-            
-            # Generate indicators based on real price data
-            indicators = self.generate_indicators(symbol, current_price, price_change_24h)
-            risk_score = self.calculate_risk_score(indicators, market_data)
-            signal, confidence = self.generate_signal(indicators, risk_score, price_change_24h)
-            
-            return {
-                'symbol': symbol,
-                'price': current_price,
-                'price_change_24h': price_change_24h,
-                'signal': signal,
-                'confidence': confidence,
-                'risk_score': risk_score,
-                'position_size': self.calculate_position_size(risk_score, confidence),
-                'targets': self.calculate_targets(current_price, signal, risk_score),
-                'indicators': indicators,
-                'source': market_data.get('source', 'unknown'),
-                'timestamp': market_data.get('last_updated', ''),
-                'fallback': market_data.get('source') == 'fallback'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error generating signal for {symbol}: {e}")
-            return self._get_default_signal(symbol)
-    
-    def generate_indicators(self, symbol, current_price, price_change_24h):
-        """Generate technical indicators based on real data"""
-        # Create varied RSI values based on symbol and price action
-        symbol_hash = hash(symbol) % 100
-        
-        # Base RSI influenced by price change
-        if price_change_24h > 8:
-            base_rsi = np.random.uniform(65, 80)  # Overbought territory
-            trend = 'bullish'
-        elif price_change_24h < -6:
-            base_rsi = np.random.uniform(20, 35)  # Oversold territory  
-            trend = 'bearish'
-        elif price_change_24h > 2:
-            base_rsi = np.random.uniform(55, 70)  # Bullish
-            trend = 'bullish'
-        elif price_change_24h < -2:
-            base_rsi = np.random.uniform(30, 45)  # Bearish
-            trend = 'bearish'
-        else:
-            base_rsi = np.random.uniform(40, 60)  # Neutral
-            trend = 'neutral'
-        
-        # Add symbol-specific bias for signal variety
-        if symbol_hash < 20:
-            base_rsi = max(20, base_rsi - 15)  # Some coins trend oversold
-            trend = 'bearish'
-        elif symbol_hash > 80:
-            base_rsi = min(80, base_rsi + 15)  # Some coins trend overbought
-            trend = 'bullish'
-        
-        return {
-            'rsi': round(base_rsi, 1),
-            'macd': round(np.random.uniform(-1.5, 1.5), 3),
-            'macd_signal': round(np.random.uniform(-1.2, 1.2), 3),
-            'trend': trend,
-            'volatility': abs(price_change_24h) / 100,
-            'momentum': price_change_24h / 100
-        }
-    
-    def generate_signal(self, indicators, risk_score, price_change_24h):
-        """Generate mixed trading signals"""
-        rsi = indicators.get('rsi', 50)
-        trend = indicators.get('trend', 'neutral')
-        
-        signal_score = 0
-        confidence = 0.6
-        
-        # RSI-based signals
-        if rsi < 25:
-            signal_score += 3
-            confidence += 0.25
-        elif rsi < 35:
-            signal_score += 2
-            confidence += 0.15
-        elif rsi > 75:
-            signal_score -= 3
-            confidence += 0.25
-        elif rsi > 65:
-            signal_score -= 2
-            confidence += 0.15
-        
-        # Trend-based signals
-        if trend == 'bullish':
-            signal_score += 1
-        elif trend == 'bearish':
-            signal_score -= 1
-        
-        # Price momentum (contrarian approach)
-        if price_change_24h < -8:
-            signal_score += 1  # Big dip = potential buy
-        elif price_change_24h > 8:
-            signal_score -= 1  # Big pump = potential sell
-        
-        # Add some randomness for realistic variety
-        random_factor = np.random.uniform(-1, 1)
-        signal_score += random_factor
-        
-        # Risk adjustment
-        if risk_score > 7:
-            signal_score *= 0.6
-        elif risk_score > 5:
-            signal_score *= 0.8
-        
-        # Determine final signal
-        if signal_score >= 2.5:
-            signal = "STRONG BUY"
-            confidence = min(0.95, confidence + 0.2)
-        elif signal_score >= 1.5:
-            signal = "BUY"
-            confidence = min(0.85, confidence + 0.1)
-        elif signal_score <= -2.5:
-            signal = "STRONG SELL"
-            confidence = min(0.95, confidence + 0.2)
-        elif signal_score <= -1.5:
-            signal = "SELL"
-            confidence = min(0.85, confidence + 0.1)
-        else:
-            signal = "HOLD"
-            confidence = max(0.5, confidence)
-        
-        return signal, round(confidence, 2)
-    
-    def calculate_risk_score(self, indicators, market_data):
-        """Calculate risk score"""
-        risk_score = 5
-        
-        rsi = indicators.get('rsi', 50)
-        volatility = indicators.get('volatility', 0.02)
-        price_change = abs(market_data.get('price_change_24h', 0))
-        
-        # RSI risk
-        if rsi > 80 or rsi < 20:
-            risk_score += 3
-        elif rsi > 70 or rsi < 30:
-            risk_score += 1
-        
-        # Volatility risk
-        if volatility > 0.1:
-            risk_score += 2
-        elif volatility > 0.05:
-            risk_score += 1
-        
-        return min(10, max(1, risk_score))
-    
-    def calculate_position_size(self, risk_score, confidence):
-        """Calculate position size recommendation"""
-        base_size = 1000
-        risk_multiplier = 1 - (risk_score / 20)
-        position_size = base_size * risk_multiplier * confidence
-        
-        if position_size < 200:
-            return "Small (≤$200)"
-        elif position_size < 600:
-            return "Medium ($200-$600)"
-        else:
-            return "Large ($600-$1000)"
-    
-    def calculate_targets(self, current_price, signal, risk_score):
-        """Calculate realistic profit targets"""
-        if "STRONG BUY" in signal:
-            take_profit = current_price * 1.15
-            stop_loss = current_price * 0.88
-        elif "BUY" in signal:
-            take_profit = current_price * 1.10
-            stop_loss = current_price * 0.92
-        elif "STRONG SELL" in signal:
-            take_profit = current_price * 0.85
-            stop_loss = current_price * 1.12
-        elif "SELL" in signal:
-            take_profit = current_price * 0.90
-            stop_loss = current_price * 1.08
-        else:
-            take_profit = current_price * 1.05
-            stop_loss = current_price * 0.95
-        
-        # Adjust for risk
-        risk_adjust = 1 - (risk_score * 0.005)
-        take_profit *= risk_adjust
-        
-        # Calculate risk/reward ratio
-        price_diff = abs(take_profit - current_price)
-        stop_diff = abs(current_price - stop_loss)
-        
-        if stop_diff > 0:
-            risk_reward = round(price_diff / stop_diff, 2)
-        else:
-            risk_reward = 1.0
-        
-        return {
-            'take_profit': round(take_profit, 3),
-            'stop_loss': round(stop_loss, 3),
-            'risk_reward_ratio': risk_reward
-        }
-    
-    def _get_default_signal(self, symbol):
-        """Default signal when analysis fails"""
-        fallback_prices = {
-            'BTC': 43450, 'ETH': 2350, 'ADA': 0.48, 'SOL': 102,
-            'DOT': 6.85, 'MATIC': 0.78, 'BNB': 315, 'XRP': 0.57,
-            'DOGE': 0.085, 'AVAX': 36.5
-        }
-        
-        price = fallback_prices.get(symbol, 100)
-        
-        return {
-            'symbol': symbol,
-            'price': price,
-            'price_change_24h': 0,
-            'signal': "HOLD",
-            'confidence': 0.5,
-            'risk_score': 5,
-            'position_size': "Medium ($200-$600)",
-            'targets': {
-                'take_profit': round(price * 1.05, 3),
-                'stop_loss': round(price * 0.95, 3),
-                'risk_reward_ratio': 1.0
-            },
-            'indicators': {
-                'rsi': 50.0,
-                'macd': 0.0,
-                'macd_signal': 0.0,
-                'trend': 'neutral',
-                'volatility': 0.02,
-                'momentum': 0.0
-            },
-            'source': 'fallback',
-            'timestamp': datetime.now().timestamp(),
-            'fallback': True
-        }
-
-# Initialize analyzer
-analyzer = ReliableCryptoAnalyzer()
-
-# HTML Template (same as before, but keep it)
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Reliable Crypto Signals</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            background: linear-gradient(135deg, #0f172a 0%, #1e1b4b 100%); 
-            color: #f8fafc; 
-            min-height: 100vh; 
-            padding: 20px; 
-        }
-        .container { max-width: 1400px; margin: 0 auto; }
-        .header { 
-            text-align: center; 
-            margin-bottom: 30px; 
-            padding: 25px; 
-            background: rgba(30, 41, 59, 0.9);
-            border-radius: 15px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-        .header h1 { 
-            font-size: 2.8rem; 
-            background: linear-gradient(135deg, #00ff87, #60efff);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }
-        .controls { 
-            display: flex; 
-            gap: 15px; 
-            justify-content: center; 
-            margin: 20px 0; 
-        }
-        .btn { 
-            padding: 12px 24px; 
-            border: none; 
-            border-radius: 8px; 
-            font-weight: bold; 
-            cursor: pointer; 
-            background: #2563eb; 
-            color: white; 
-            transition: all 0.3s ease; 
-        }
-        .btn:hover { transform: translateY(-2px); background: #1d4ed8; }
-        .stats-bar { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 30px; }
-        .stat-card { background: #1e293b; padding: 20px; border-radius: 12px; text-align: center; border-left: 4px solid #2563eb; }
-        .signals-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 20px; margin-bottom: 30px; }
-        .signal-card { background: #1e293b; border-radius: 15px; padding: 20px; border: 1px solid rgba(255, 255, 255, 0.1); transition: all 0.3s ease; position: relative; }
-        .signal-card::before { content: ''; position: absolute; top: 0; left: 0; right: 0; height: 4px; }
-        .signal-card.strong-buy::before { background: #10b981; }
-        .signal-card.buy::before { background: #10b981; opacity: 0.7; }
-        .signal-card.strong-sell::before { background: #ef4444; }
-        .signal-card.sell::before { background: #ef4444; opacity: 0.7; }
-        .signal-card.hold::before { background: #6b7280; }
-        .signal-card:hover { transform: translateY(-5px); box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3); }
-        .coin-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px; }
-        .coin-symbol { font-size: 1.6rem; font-weight: bold; color: #60efff; }
-        .signal-badge { padding: 8px 16px; border-radius: 20px; font-weight: bold; font-size: 0.85rem; }
-        .strong-buy .signal-badge { background: #10b981; color: white; }
-        .buy .signal-badge { background: #10b981; color: white; opacity: 0.8; }
-        .strong-sell .signal-badge { background: #ef4444; color: white; }
-        .sell .signal-badge { background: #ef4444; color: white; opacity: 0.8; }
-        .hold .signal-badge { background: #6b7280; color: white; }
-        .price-section { margin: 15px 0; }
-        .price { font-size: 2rem; font-weight: bold; color: #60efff; margin-bottom: 5px; }
-        .price-change { font-size: 1rem; font-weight: bold; }
-        .price-change.positive { color: #10b981; }
-        .price-change.negative { color: #ef4444; }
-        .confidence-meter { height: 8px; background: rgba(255, 255, 255, 0.1); border-radius: 4px; margin: 15px 0; overflow: hidden; }
-        .confidence-fill { height: 100%; border-radius: 4px; transition: width 0.3s ease; }
-        .strong-buy .confidence-fill { background: #10b981; }
-        .buy .confidence-fill { background: #10b981; opacity: 0.8; }
-        .strong-sell .confidence-fill { background: #ef4444; }
-        .sell .confidence-fill { background: #ef4444; opacity: 0.8; }
-        .hold .confidence-fill { background: #6b7280; }
-        .indicators { display: grid; grid-template-columns: 1fr 1fr; gap: 12px; margin: 20px 0; }
-        .indicator { text-align: center; padding: 10px; background: rgba(255, 255, 255, 0.05); border-radius: 8px; }
-        .indicator-value { font-size: 1.1rem; font-weight: bold; margin-top: 5px; color: #60efff; }
-        .targets { background: rgba(255, 255, 255, 0.05); padding: 15px; border-radius: 10px; margin-top: 15px; }
-        .target-row { display: flex; justify-content: space-between; margin: 8px 0; font-size: 0.9rem; }
-        .footer { text-align: center; margin-top: 40px; padding: 25px; color: #94a3b8; font-size: 0.9rem; background: rgba(30, 41, 59, 0.8); border-radius: 12px; }
-        .risk-score { text-align: center; margin: 12px 0; font-size: 0.9rem; }
-        .risk-low { color: #10b981; }
-        .risk-medium { color: #f59e0b; }
-        .risk-high { color: #ef4444; }
-        .status-info { text-align: center; margin: 10px 0; font-size: 0.85rem; color: #60efff; }
-        .source-badge { text-align: center; margin-top: 10px; font-size: 0.8rem; color: #10b981; }
-        .fallback-warning { text-align: center; margin-top: 10px; font-size: 0.8rem; color: #f59e0b; }
-        @media (max-width: 768px) { .signals-grid { grid-template-columns: 1fr; } .header h1 { font-size: 2rem; } .controls { flex-direction: column; } .btn { width: 100%; } }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔒 Reliable Crypto Signals</h1>
-            <p>Single API Source • Consistent Data • Mixed Trading Signals</p>
-            <div class="controls">
-                <button class="btn" onclick="refreshData()">🔄 Refresh Signals</button>
-            </div>
-            <div class="status-info">
-                Last update: {{ current_time }} | Next update in: <span id="countdown">30</span>s
-            </div>
-        </div>
-        
-        <div class="stats-bar">
-            <div class="stat-card"><h3>Coins Tracked</h3><p style="font-size: 1.8rem; font-weight: bold; color: #60efff;">{{ signals|length }}</p></div>
-            <div class="stat-card"><h3>Data Source</h3><p style="font-size: 1.8rem; font-weight: bold; color: #10b981;">CoinGecko</p></div>
-            <div class="stat-card"><h3>Update Frequency</h3><p style="font-size: 1.8rem; font-weight: bold; color: #60efff;">30s</p></div>
-            <div class="stat-card"><h3>Signal Variety</h3><p style="font-size: 1.8rem; font-weight: bold; color: #10b981;">Mixed</p></div>
-        </div>
-        
-        <div class="signals-grid">
-            {% for signal in signals %}
-            <div class="signal-card {{ signal.signal_class }}">
-                <div class="coin-header">
-                    <div class="coin-symbol">{{ signal.symbol }}</div>
-                    <div class="signal-badge">{{ signal.signal }}</div>
-                </div>
-                <div class="price-section">
-                    <div class="price">${{ "%.3f"|format(signal.price) if signal.price < 1 else "%.2f"|format(signal.price) }}</div>
-                    <div class="price-change {% if signal.price_change_24h >= 0 %}positive{% else %}negative{% endif %}">
-                        {{ "%+.2f"|format(signal.price_change_24h) }}%
-                    </div>
-                </div>
-                <div class="confidence-meter">
-                    <div class="confidence-fill" style="width: {{ (signal.confidence * 100)|round }}%;"></div>
-                </div>
-                <div style="text-align: center; font-size: 0.85rem; margin-bottom: 15px;">Confidence: {{ "%.0f"|format(signal.confidence * 100) }}%</div>
-                <div class="risk-score">Risk: <span class="{% if signal.risk_score <= 3 %}risk-low{% elif signal.risk_score <= 6 %}risk-medium{% else %}risk-high{% endif %}">{{ signal.risk_score }}/10</span></div>
-                <div class="indicators">
-                    <div class="indicator"><div>RSI</div><div class="indicator-value">{{ "%.1f"|format(signal.indicators.rsi) }}</div></div>
-                    <div class="indicator"><div>Trend</div><div class="indicator-value" style="font-size: 0.9rem; text-transform: capitalize;">{{ signal.indicators.trend }}</div></div>
-                </div>
-                <div class="targets">
-                    <div class="target-row"><span>Take Profit:</span><span>${{ "%.3f"|format(signal.targets.take_profit) if signal.targets.take_profit < 1 else "%.2f"|format(signal.targets.take_profit) }}</span></div>
-                    <div class="target-row"><span>Stop Loss:</span><span>${{ "%.3f"|format(signal.targets.stop_loss) if signal.targets.stop_loss < 1 else "%.2f"|format(signal.targets.stop_loss) }}</span></div>
-                    <div class="target-row"><span>Risk/Reward:</span><span>{{ "%.2f"|format(signal.targets.risk_reward_ratio) }}:1</span></div>
-                </div>
-                <div style="text-align: center; margin-top: 12px;">
-                    <div class="indicator" style="display: inline-block; padding: 6px 12px;">
-                        <div style="font-size: 0.8rem;">Position Size</div>
-                        <div style="font-weight: bold; font-size: 0.9rem;">{{ signal.position_size }}</div>
-                    </div>
-                </div>
-                {% if signal.fallback %}
-                <div class="fallback-warning">⚠️ Using simulated data (API offline)</div>
-                {% else %}
-                <div class="source-badge">✅ Live data from CoinGecko</div>
-                {% endif %}
-            </div>
-            {% endfor %}
-        </div>
-        
-        <div class="footer">
-            <p>🔒 Single reliable data source: CoinGecko API</p>
-            <p>📊 Mixed BUY/SELL/HOLD signals based on technical analysis</p>
-            <p>⚡ Updates every 30 seconds • Consistent data on refresh</p>
-            <p style="margin-top: 10px; color: #ef4444;">⚠️ Educational purpose only. Always do your own research.</p>
-        </div>
-    </div>
-
-    <script>
-        let countdown = 30;
-        function updateCountdown() {
-            document.getElementById('countdown').textContent = countdown;
-            countdown = countdown <= 0 ? 30 : countdown - 1;
-        }
-        function refreshData() {
-            window.location.href = '/?refresh=true&t=' + new Date().getTime();
-        }
-        setInterval(updateCountdown, 1000);
-        setInterval(refreshData, 30000);
-    </script>
-</body>
-</html>
-'''
-
-@app.route('/')
-def index():
-    """Main dashboard"""
-    try:
-        refresh = request.args.get('refresh', 'false').lower() == 'true'
-        if refresh:
-            analyzer.force_refresh_all_data()
-        
-        signals = []
-        for coin in analyzer.coins:
-            signal_data = analyzer.generate_trading_signals(coin)
-            
-            signal_lower = signal_data['signal'].lower()
-            if 'strong buy' in signal_lower:
-                signal_class = 'strong-buy'
-            elif 'buy' in signal_lower:
-                signal_class = 'buy'
-            elif 'strong sell' in signal_lower:
-                signal_class = 'strong-sell'
-            elif 'sell' in signal_lower:
-                signal_class = 'sell'
-            else:
-                signal_class = 'hold'
-            
-            signal_data['signal_class'] = signal_class
-            signals.append(signal_data)
-        
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return render_template_string(HTML_TEMPLATE, signals=signals, current_time=current_time)
-        
-    except Exception as e:
-        logging.error(f"Error in main route: {e}")
-        return f"<h1>Error loading signals</h1><p>{e}</p>", 500
-
-
-if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+
+from flask import Flask, request, jsonify
+import requests
+import numpy as np
+from datetime import datetime
+import time
+import threading
+import atexit
+import functools
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _njit import njit
+
+# Optional, like numba: compressed responses when available, plain otherwise
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Configure logging, but only if a WSGI reload has not already done so -
+# duplicate handlers mean every log line is emitted N times
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(message)s'
+    )
+
+app = Flask(__name__)
+
+# The page compresses ~5x (CSS repetition), so gzip/brotli the responses
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    Compress(app)
+
+# Frozen request/fallback constants, shared by every analyzer path
+_COIN_IDS = ('bitcoin', 'ethereum', 'cardano', 'solana', 'polkadot',
+             'matic-network', 'binancecoin', 'ripple', 'dogecoin', 'avalanche-2')
+
+_COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
+_COINGECKO_PARAMS = MappingProxyType({
+    'ids': ','.join(_COIN_IDS),
+    'vs_currencies': 'usd',
+    'include_24hr_change': 'true',
+    'include_24hr_vol': 'true',
+    'include_last_updated_at': 'true'
+})
+
+_COIN_MAPPING = MappingProxyType({
+    'bitcoin': 'BTC', 'ethereum': 'ETH', 'cardano': 'ADA',
+    'solana': 'SOL', 'polkadot': 'DOT', 'matic-network': 'MATIC',
+    'binancecoin': 'BNB', 'ripple': 'XRP', 'dogecoin': 'DOGE',
+    'avalanche-2': 'AVAX'
+})
+
+# Read-only so it can be shared across threads without copying
+_FALLBACK_PRICES = MappingProxyType({
+    'BTC': 43450, 'ETH': 2350, 'ADA': 0.48, 'SOL': 102,
+    'DOT': 6.85, 'MATIC': 0.78, 'BNB': 315, 'XRP': 0.57,
+    'DOGE': 0.085, 'AVAX': 36.5
+})
+
+# Signal names in score order; the scoring kernel returns indexes into
+# this, and the CSS classes are precomputed in the same order
+_SIGNALS = ('STRONG SELL', 'SELL', 'HOLD', 'BUY', 'STRONG BUY')
+_SIGNAL_CLASSES = tuple(s.lower().replace(' ', '-') for s in _SIGNALS)
+
+_POSITION_LABELS = ("Small (≤$200)", "Medium ($200-$600)", "Large ($600-$1000)")
+
+_TREND_CODES = MappingProxyType({'bullish': 1.0, 'bearish': -1.0, 'neutral': 0.0})
+
+
+@njit(cache=True)
+def _score_signals(rsi, trend_code, pc24, risk, noise, price):
+    """Score all symbols in one pass over struct-of-arrays inputs.
+
+    Returns indexes into _SIGNALS, raw confidences, take-profit/stop-loss
+    prices, risk/reward ratios and indexes into _POSITION_LABELS. The
+    branchy scalar logic lives here so numba, when present, compiles it to
+    a tight loop.
+    """
+    n = rsi.shape[0]
+    sig_idx = np.empty(n, dtype=np.int64)
+    conf = np.empty(n, dtype=np.float64)
+    tp = np.empty(n, dtype=np.float64)
+    sl = np.empty(n, dtype=np.float64)
+    rr = np.empty(n, dtype=np.float64)
+    pos_idx = np.empty(n, dtype=np.int64)
+
+    for i in range(n):
+        score = noise[i]
+        c = 0.6
+
+        # RSI-based signals
+        if rsi[i] < 25:
+            score += 3
+            c += 0.25
+        elif rsi[i] < 35:
+            score += 2
+            c += 0.15
+        elif rsi[i] > 75:
+            score -= 3
+            c += 0.25
+        elif rsi[i] > 65:
+            score -= 2
+            c += 0.15
+
+        # Trend-based signals (bullish +1, bearish -1)
+        score += trend_code[i]
+
+        # Price momentum (contrarian approach)
+        if pc24[i] < -8:
+            score += 1
+        elif pc24[i] > 8:
+            score -= 1
+
+        # Risk adjustment
+        if risk[i] > 7:
+            score *= 0.6
+        elif risk[i] > 5:
+            score *= 0.8
+
+        # Bucket into _SIGNALS index and bump confidence
+        if score >= 2.5:
+            idx = 4
+            c = min(0.95, c + 0.2)
+        elif score >= 1.5:
+            idx = 3
+            c = min(0.85, c + 0.1)
+        elif score <= -2.5:
+            idx = 0
+            c = min(0.95, c + 0.2)
+        elif score <= -1.5:
+            idx = 1
+            c = min(0.85, c + 0.1)
+        else:
+            idx = 2
+            c = max(0.5, c)
+
+        sig_idx[i] = idx
+        conf[i] = c
+
+        # Profit targets per signal bucket, take-profit shaded by risk
+        if idx == 4:
+            tp_mult, sl_mult = 1.15, 0.88
+        elif idx == 3:
+            tp_mult, sl_mult = 1.10, 0.92
+        elif idx == 0:
+            tp_mult, sl_mult = 0.85, 1.12
+        elif idx == 1:
+            tp_mult, sl_mult = 0.90, 1.08
+        else:
+            tp_mult, sl_mult = 1.05, 0.95
+
+        tp[i] = price[i] * tp_mult * (1.0 - risk[i] * 0.005)
+        sl[i] = price[i] * sl_mult
+
+        stop_diff = abs(price[i] - sl[i])
+        if stop_diff > 0:
+            rr[i] = abs(tp[i] - price[i]) / stop_diff
+        else:
+            rr[i] = 1.0
+
+        # Position-size bucket
+        position = 1000.0 * (1.0 - risk[i] / 20.0) * c
+        if position < 200.0:
+            pos_idx[i] = 0
+        elif position < 600.0:
+            pos_idx[i] = 1
+        else:
+            pos_idx[i] = 2
+
+    return sig_idx, conf, tp, sl, rr, pos_idx
+
+
+# Slotted result types: far smaller than the 10+ key dicts they replace,
+# faster attribute access in the template loop, and orjson serializes
+# dataclasses natively for the JSON endpoint
+@dataclass(slots=True)
+class Indicators:
+    rsi: float
+    macd: float
+    macd_signal: float
+    trend: str
+    volatility: float
+    momentum: float
+
+
+@dataclass(slots=True)
+class Targets:
+    take_profit: float
+    stop_loss: float
+    risk_reward_ratio: float
+
+
+@dataclass(slots=True)
+class Signal:
+    symbol: str
+    price: float
+    price_change_24h: float
+    signal: str
+    confidence: float
+    risk_score: int
+    position_size: str
+    targets: Targets
+    indicators: Indicators
+    source: str
+    timestamp: float
+    fallback: bool
+    signal_class: str = 'hold'
+    # Preformatted display strings so the template is straight-line
+    # concatenation instead of a conditional format filter per value
+    price_str: str = ''
+    take_profit_str: str = ''
+    stop_loss_str: str = ''
+
+
+def _fmt_price(p):
+    """Format a price for display: sub-dollar coins get an extra decimal"""
+    return f"{p:.3f}" if p < 1 else f"{p:.2f}"
+
+
+class ReliableCryptoAnalyzer:
+    # Fixed attribute set: slot descriptors are cheaper to read than a
+    # __dict__ lookup on the hot paths, and typos fail loudly
+    __slots__ = ('coins', 'cache_generation', '_signals_json', '_signals_cache',
+                 '_price_entry', '_fetch_lock', 'http', '_rng', '_rng_lock',
+                 '_tls', '_symbol_hashes', '_symbol_fallback_price',
+                 '_refresh_thread')
+
+    cache_duration = 30
+
+    def __init__(self):
+        self.coins = ['BTC', 'ETH', 'ADA', 'SOL', 'DOT', 'MATIC', 'BNB', 'XRP', 'DOGE', 'AVAX']
+
+        # Bumped whenever the price data actually changes, so responses can
+        # carry a cheap validator instead of hashing their payload
+        self.cache_generation = 0
+        self._signals_json = None
+
+        # Fully-built signal list, cached as an immutable (signals,
+        # generation) tuple like the price entry, so reads are lock-free
+        self._signals_cache = None
+
+        # Price cache as a single immutable (result, deadline) tuple: readers
+        # take no lock at all, writers swap the whole tuple under _fetch_lock
+        self._price_entry = None
+        self._fetch_lock = threading.Lock()
+
+        # Pooled HTTP session: keep-alive reuses the TLS connection across
+        # refreshes instead of paying a handshake per cache miss
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        self.http.headers.update({
+            'Accept': 'application/json',
+            'User-Agent': 'crypto-signals/1.0',
+            'Accept-Encoding': 'gzip'
+        })
+        atexit.register(self.http.close)
+
+        # Root PCG64 generator; each thread draws from its own spawned
+        # child stream, since Generator is not safe for concurrent draws
+        # and the background refresher shares these paths with requests
+        self._rng = np.random.default_rng()
+        self._rng_lock = threading.Lock()
+        self._tls = threading.local()
+
+        # Per-symbol metadata is fixed for the process lifetime, so compute
+        # it once up front instead of hashing and defaulting per call.
+        # crc32 rather than hash(): stable across processes and restarts,
+        # so the per-coin bias does not flip with PYTHONHASHSEED
+        self._symbol_hashes = {s: zlib.crc32(s.encode()) % 100 for s in self.coins}
+        self._symbol_fallback_price = {s: _FALLBACK_PRICES.get(s, 100) for s in self.coins}
+
+        # Keep the signal cache warm from a daemon thread so no user
+        # request ever has to wait on CoinGecko
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_worker, daemon=True, name='signals-refresh')
+        self._refresh_thread.start()
+
+    def _thread_rng(self):
+        """Per-thread generator spawned from the root bit stream"""
+        rng = getattr(self._tls, 'rng', None)
+        if rng is None:
+            with self._rng_lock:
+                rng = self._rng.spawn(1)[0]
+            self._tls.rng = rng
+        return rng
+
+    def get_all_prices(self):
+        """Get all prices in one API call - more reliable"""
+        # Lock-free fast path: reading the entry tuple is a single atomic
+        # dict-slot load, so concurrent readers never serialize on a hit
+        entry = self._price_entry
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        return self._refresh_prices(entry)
+
+    def _refresh_prices(self, stale_entry):
+        """Refresh the price cache; only one thread revalidates at a time.
+
+        Readers holding stale data return it immediately rather than queueing
+        behind the in-flight HTTP call; only a completely cold cache blocks.
+        """
+        if stale_entry is not None:
+            if not self._fetch_lock.acquire(blocking=False):
+                return stale_entry[0]
+        else:
+            self._fetch_lock.acquire()
+
+        try:
+            # Re-check: another thread may have refreshed while we waited
+            entry = self._price_entry
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+
+            try:
+                result = self._fetch_prices_uncached()
+            except Exception as e:
+                logging.error(f"Error fetching data from CoinGecko: {e}")
+                if entry is not None:
+                    # Stale live data beats simulated fallback
+                    return entry[0]
+                return self._get_all_fallback_data()
+
+            self._price_entry = (result, time.monotonic() + self.cache_duration)
+            return result
+        finally:
+            self._fetch_lock.release()
+
+    def _fetch_prices_uncached(self):
+        """Fetch live prices from CoinGecko; raises on failure so errors are not cached"""
+        # Use the simple price endpoint that works better
+        response = self.http.get(_COINGECKO_URL, params=_COINGECKO_PARAMS,
+                                 timeout=(3.05, 10))
+
+        if response.status_code != 200:
+            raise RuntimeError(f"CoinGecko API error: {response.status_code}")
+
+        data = orjson.loads(response.content)
+        result = {}
+
+        for coin_id, coin_data in data.items():
+            symbol = _COIN_MAPPING.get(coin_id)
+            if symbol:
+                result[symbol] = {
+                    'price': coin_data.get('usd', 0),
+                    'price_change_24h': coin_data.get('usd_24h_change', 0),
+                    'volume': coin_data.get('usd_24h_vol', 0),
+                    'last_updated': coin_data.get('last_updated_at', 0),
+                    'source': 'coingecko'
+                }
+
+        # Fill any missing coins with fallback, generated as one batch
+        missing = [s for s in self.coins if s not in result]
+        if missing:
+            result.update(self._get_fallback_batch(missing))
+
+        # Serialized by _fetch_lock, so a plain increment is safe here
+        self.cache_generation += 1
+
+        logging.info(f"✅ Successfully fetched live data for {len(result)} coins")
+        return result
+    
+    def _get_all_fallback_data(self):
+        """Fallback data when API fails"""
+        result = self._get_fallback_batch(self.coins)
+        logging.info("⚠️ Using fallback data (API unavailable)")
+        return result
+
+    def _get_fallback_data(self, symbol):
+        """Individual fallback data"""
+        return self._get_fallback_batch([symbol])[symbol]
+
+    def _get_fallback_batch(self, symbols):
+        """Fallback rows for several symbols from one batched random draw"""
+        # Small random variation so fallback data does not look frozen;
+        # tolist() keeps the payload as plain floats
+        rng = self._thread_rng()
+        variation = rng.uniform(-0.02, 0.02, size=len(symbols)).tolist()
+        changes = rng.uniform(-5, 5, size=len(symbols)).tolist()
+        now = time.time()
+
+        result = {}
+        for i, symbol in enumerate(symbols):
+            price = self._symbol_fallback_price.get(symbol) or _FALLBACK_PRICES.get(symbol, 100)
+            result[symbol] = {
+                'price': price * (1 + variation[i]),
+                'price_change_24h': changes[i],
+                'volume': 0,
+                'last_updated': now,
+                'source': 'fallback'
+            }
+        return result
+    
+    def _refresh_worker(self):
+        """Rebuild the signal cache every TTL window, off the request path"""
+        while True:
+            try:
+                self._rebuild_signals()
+            except Exception as e:
+                logging.error(f"Background signal refresh failed: {e}")
+            time.sleep(self.cache_duration)
+
+    def _rebuild_signals(self):
+        """Recompute the signal list and publish it for the current generation"""
+        signals = self.generate_trading_signals_batch(self.coins)
+        self._signals_cache = (signals, self.cache_generation)
+        return signals
+
+    def get_cached_signals(self):
+        """Precomputed signal list; normally served straight from the cache"""
+        cached = self._signals_cache
+        if cached is not None and cached[1] == self.cache_generation:
+            return cached[0]
+        # Cold start or a forced refresh raced the background thread
+        return self._rebuild_signals()
+
+    def get_signals_json(self):
+        """Serialized signals payload, rebuilt only when the cache generation moves"""
+        generation = self.cache_generation
+        cached_payload = self._signals_json
+        if cached_payload is not None and cached_payload[0] == generation:
+            return cached_payload[1]
+
+        # OPT_SERIALIZE_NUMPY: any numpy scalar that slips through the
+        # vectorized pipeline serializes instead of raising
+        payload = orjson.dumps(self.get_cached_signals(), option=orjson.OPT_SERIALIZE_NUMPY)
+        self._signals_json = (generation, payload)
+        return payload
+
+    def force_refresh_all_data(self):
+        """Force refresh all cached data"""
+        self._price_entry = None
+        self.cache_generation += 1
+        logging.info("🔄 All data cache cleared - forcing refresh")
+    
+    def generate_trading_signals(self, symbol):
+        """Generate trading signals based on reliable data"""
+        return self.generate_trading_signals_batch([symbol])[0]
+
+    def generate_trading_signals_batch(self, symbols):
+        """Generate trading signals for all symbols from a single price fetch"""
+        all_data = self.get_all_prices()
+        signals = [None] * len(symbols)
+
+        # .get(symbol, fallback()) would build the fallback eagerly even on
+        # hits, so only construct it when the symbol is actually missing
+        market_rows = []
+        for symbol in symbols:
+            market_data = all_data.get(symbol)
+            if market_data is None:
+                market_data = self._get_fallback_data(symbol)
+            market_rows.append(market_data)
+
+        # Generate indicators for all symbols in one vectorized pass
+        price_changes = [md['price_change_24h'] for md in market_rows]
+        indicators_list = self._generate_indicators_batch(symbols, price_changes)
+
+        # Score every symbol in a single kernel pass over SoA arrays
+        risk_scores = [self.calculate_risk_score(indicators_list[i], market_rows[i])
+                       for i in range(len(symbols))]
+        sig_idx, conf, tp, sl, rr, pos_idx = _score_signals(
+            np.array([ind.rsi for ind in indicators_list]),
+            np.array([_TREND_CODES[ind.trend] for ind in indicators_list]),
+            np.asarray(price_changes, dtype=float),
+            np.asarray(risk_scores, dtype=float),
+            self._thread_rng().uniform(-1, 1, size=len(symbols)),
+            np.array([md['price'] for md in market_rows], dtype=float)
+        )
+        sig_idx = sig_idx.tolist()
+        conf = np.round(conf, 2).tolist()
+        tp = np.round(tp, 3).tolist()
+        sl = np.round(sl, 3).tolist()
+        rr = np.round(rr, 2).tolist()
+        pos_idx = pos_idx.tolist()
+
+        for i, symbol in enumerate(symbols):
+            try:
+                market_data = market_rows[i]
+
+                current_price = market_data['price']
+                price_change_24h = market_data['price_change_24h']
+
+                indicators = indicators_list[i]
+                risk_score = risk_scores[i]
+                signal = _SIGNALS[sig_idx[i]]
+                confidence = conf[i]
+                source = market_data.get('source', 'unknown')
+
+                signals[i] = Signal(
+                    symbol=symbol,
+                    price=current_price,
+                    price_change_24h=price_change_24h,
+                    signal=signal,
+                    confidence=confidence,
+                    risk_score=risk_score,
+                    position_size=_POSITION_LABELS[pos_idx[i]],
+                    targets=Targets(
+                        take_profit=tp[i],
+                        stop_loss=sl[i],
+                        risk_reward_ratio=rr[i]
+                    ),
+                    indicators=indicators,
+                    source=source,
+                    timestamp=market_data.get('last_updated', ''),
+                    fallback=source == 'fallback',
+                    signal_class=_SIGNAL_CLASSES[sig_idx[i]],
+                    price_str=_fmt_price(current_price),
+                    take_profit_str=_fmt_price(tp[i]),
+                    stop_loss_str=_fmt_price(sl[i])
+                )
+
+            except Exception as e:
+                logging.error(f"Error generating signal for {symbol}: {e}")
+                signals[i] = self._get_default_signal(symbol)
+
+        return signals
+    
+    def _generate_indicators_batch(self, symbols, price_changes):
+        """Generate technical indicators for all symbols in one NumPy pass"""
+        n = len(symbols)
+        rng = self._thread_rng()
+        changes = np.asarray(price_changes, dtype=float)
+
+        # Base RSI band influenced by price change: overbought on big pumps,
+        # oversold on big dips, neutral in between
+        bins = [changes > 8, changes < -6, changes > 2, changes < -2]
+        band_low = np.select(bins, [65.0, 20.0, 55.0, 30.0], default=40.0)
+        band_high = np.select(bins, [80.0, 35.0, 70.0, 45.0], default=60.0)
+        rsi = band_low + (band_high - band_low) * rng.uniform(0.0, 1.0, size=n)
+        trend_code = np.select(bins, [1, -1, 1, -1], default=0)
+
+        # Symbol-specific bias for signal variety, from the precomputed hashes
+        sym_hash = np.array([self._symbol_hashes.get(s) or zlib.crc32(s.encode()) % 100
+                             for s in symbols])
+        rsi = np.where(sym_hash < 20, np.maximum(20.0, rsi - 15), rsi)
+        rsi = np.where(sym_hash > 80, np.minimum(80.0, rsi + 15), rsi)
+        trend_code = np.where(sym_hash < 20, -1, trend_code)
+        trend_code = np.where(sym_hash > 80, 1, trend_code)
+
+        macd = rng.uniform(-1.5, 1.5, size=n)
+        macd_signal = rng.uniform(-1.2, 1.2, size=n)
+
+        # Round each field once as an array; tolist() hands back plain floats
+        rsi = np.round(rsi, 1).tolist()
+        macd = np.round(macd, 3).tolist()
+        macd_signal = np.round(macd_signal, 3).tolist()
+        trend_code = trend_code.tolist()
+        changes = changes.tolist()
+
+        return [
+            Indicators(
+                rsi=rsi[i],
+                macd=macd[i],
+                macd_signal=macd_signal[i],
+                trend='bullish' if trend_code[i] == 1 else 'bearish' if trend_code[i] == -1 else 'neutral',
+                volatility=abs(changes[i]) / 100,
+                momentum=changes[i] / 100
+            )
+            for i in range(n)
+        ]
+    
+    def calculate_risk_score(self, indicators, market_data):
+        """Calculate risk score"""
+        risk_score = 5
+
+        rsi = indicators.rsi
+        volatility = indicators.volatility
+        price_change = abs(market_data.get('price_change_24h', 0))
+        
+        # RSI risk
+        if rsi > 80 or rsi < 20:
+            risk_score += 3
+        elif rsi > 70 or rsi < 30:
+            risk_score += 1
+        
+        # Volatility risk
+        if volatility > 0.1:
+            risk_score += 2
+        elif volatility > 0.05:
+            risk_score += 1
+        
+        return min(10, max(1, risk_score))
+    
+    def _get_default_signal(self, symbol):
+        """Default signal when analysis fails"""
+        return self._default_signal_skeleton(symbol)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _default_signal_skeleton(symbol):
+        """Deterministic HOLD signal per symbol; the coin list is bounded so
+        the cache never evicts and the error path becomes a dict lookup"""
+        price = _FALLBACK_PRICES.get(symbol, 100)
+
+        return Signal(
+            symbol=symbol,
+            price=price,
+            price_change_24h=0,
+            signal="HOLD",
+            confidence=0.5,
+            risk_score=5,
+            position_size="Medium ($200-$600)",
+            targets=Targets(
+                take_profit=round(price * 1.05, 3),
+                stop_loss=round(price * 0.95, 3),
+                risk_reward_ratio=1.0
+            ),
+            indicators=Indicators(
+                rsi=50.0,
+                macd=0.0,
+                macd_signal=0.0,
+                trend='neutral',
+                volatility=0.02,
+                momentum=0.0
+            ),
+            source='fallback',
+            timestamp=time.time(),
+            fallback=True,
+            price_str=_fmt_price(price),
+            take_profit_str=_fmt_price(price * 1.05),
+            stop_loss_str=_fmt_price(price * 0.95)
+        )
+
+# Initialize analyzer
+analyzer = ReliableCryptoAnalyzer()
+
+# HTML Template (same as before, but keep it)
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Reliable Crypto Signals</title>
+    <link rel="stylesheet" href="/static/app.css?v=1">
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔒 Reliable Crypto Signals</h1>
+            <p>Single API Source • Consistent Data • Mixed Trading Signals</p>
+            <div class="controls">
+                <button class="btn" onclick="refreshData()">🔄 Refresh Signals</button>
+            </div>
+            <div class="status-info">
+                Last update: {{ current_time }} | Next update in: <span id="countdown">30</span>s
+            </div>
+        </div>
+        
+        <div class="stats-bar">
+            <div class="stat-card"><h3>Coins Tracked</h3><p style="font-size: 1.8rem; font-weight: bold; color: #60efff;">{{ signals|length }}</p></div>
+            <div class="stat-card"><h3>Data Source</h3><p style="font-size: 1.8rem; font-weight: bold; color: #10b981;">CoinGecko</p></div>
+            <div class="stat-card"><h3>Update Frequency</h3><p style="font-size: 1.8rem; font-weight: bold; color: #60efff;">30s</p></div>
+            <div class="stat-card"><h3>Signal Variety</h3><p style="font-size: 1.8rem; font-weight: bold; color: #10b981;">Mixed</p></div>
+        </div>
+        
+        <div class="signals-grid">
+            {% for signal in signals %}
+            <div class="signal-card {{ signal.signal_class }}" id="card-{{ signal.symbol }}">
+                <div class="coin-header">
+                    <div class="coin-symbol">{{ signal.symbol }}</div>
+                    <div class="signal-badge">{{ signal.signal }}</div>
+                </div>
+                <div class="price-section">
+                    <div class="price">${{ signal.price_str }}</div>
+                    <div class="price-change {% if signal.price_change_24h >= 0 %}positive{% else %}negative{% endif %}">
+                        {{ "%+.2f"|format(signal.price_change_24h) }}%
+                    </div>
+                </div>
+                <div class="confidence-meter">
+                    <div class="confidence-fill" style="width: {{ (signal.confidence * 100)|round }}%;"></div>
+                </div>
+                <div class="confidence-text" style="text-align: center; font-size: 0.85rem; margin-bottom: 15px;">Confidence: {{ "%.0f"|format(signal.confidence * 100) }}%</div>
+                <div class="risk-score">Risk: <span class="{% if signal.risk_score <= 3 %}risk-low{% elif signal.risk_score <= 6 %}risk-medium{% else %}risk-high{% endif %}">{{ signal.risk_score }}/10</span></div>
+                <div class="indicators">
+                    <div class="indicator"><div>RSI</div><div class="indicator-value rsi-value">{{ "%.1f"|format(signal.indicators.rsi) }}</div></div>
+                    <div class="indicator"><div>Trend</div><div class="indicator-value trend-value" style="font-size: 0.9rem; text-transform: capitalize;">{{ signal.indicators.trend }}</div></div>
+                </div>
+                <div class="targets">
+                    <div class="target-row"><span>Take Profit:</span><span class="tp-value">${{ signal.take_profit_str }}</span></div>
+                    <div class="target-row"><span>Stop Loss:</span><span class="sl-value">${{ signal.stop_loss_str }}</span></div>
+                    <div class="target-row"><span>Risk/Reward:</span><span class="rr-value">{{ "%.2f"|format(signal.targets.risk_reward_ratio) }}:1</span></div>
+                </div>
+                <div style="text-align: center; margin-top: 12px;">
+                    <div class="indicator" style="display: inline-block; padding: 6px 12px;">
+                        <div style="font-size: 0.8rem;">Position Size</div>
+                        <div class="position-value" style="font-weight: bold; font-size: 0.9rem;">{{ signal.position_size }}</div>
+                    </div>
+                </div>
+                {% if signal.fallback %}
+                <div class="fallback-warning">⚠️ Using simulated data (API offline)</div>
+                {% else %}
+                <div class="source-badge">✅ Live data from CoinGecko</div>
+                {% endif %}
+            </div>
+            {% endfor %}
+        </div>
+        
+        <div class="footer">
+            <p>🔒 Single reliable data source: CoinGecko API</p>
+            <p>📊 Mixed BUY/SELL/HOLD signals based on technical analysis</p>
+            <p>⚡ Updates every 30 seconds • Consistent data on refresh</p>
+            <p style="margin-top: 10px; color: #ef4444;">⚠️ Educational purpose only. Always do your own research.</p>
+        </div>
+    </div>
+
+    <script>
+        let countdown = 30;
+        function updateCountdown() {
+            document.getElementById('countdown').textContent = countdown;
+            countdown = countdown <= 0 ? 30 : countdown - 1;
+        }
+        function refreshData() {
+            window.location.href = '/?refresh=true&t=' + new Date().getTime();
+        }
+        function fmtPrice(p) {
+            return '$' + (p < 1 ? p.toFixed(3) : p.toFixed(2));
+        }
+        function updateCards(signals) {
+            signals.forEach(function(s) {
+                const card = document.getElementById('card-' + s.symbol);
+                if (!card) return;
+                card.className = 'signal-card ' + s.signal_class;
+                card.querySelector('.signal-badge').textContent = s.signal;
+                card.querySelector('.price').textContent = fmtPrice(s.price);
+                const chg = card.querySelector('.price-change');
+                chg.textContent = (s.price_change_24h >= 0 ? '+' : '') + s.price_change_24h.toFixed(2) + '%';
+                chg.className = 'price-change ' + (s.price_change_24h >= 0 ? 'positive' : 'negative');
+                card.querySelector('.confidence-fill').style.width = Math.round(s.confidence * 100) + '%';
+                card.querySelector('.confidence-text').textContent = 'Confidence: ' + Math.round(s.confidence * 100) + '%';
+                const risk = card.querySelector('.risk-score span');
+                risk.textContent = s.risk_score + '/10';
+                risk.className = s.risk_score <= 3 ? 'risk-low' : s.risk_score <= 6 ? 'risk-medium' : 'risk-high';
+                card.querySelector('.rsi-value').textContent = s.indicators.rsi.toFixed(1);
+                card.querySelector('.trend-value').textContent = s.indicators.trend;
+                card.querySelector('.tp-value').textContent = fmtPrice(s.targets.take_profit);
+                card.querySelector('.sl-value').textContent = fmtPrice(s.targets.stop_loss);
+                card.querySelector('.rr-value').textContent = s.targets.risk_reward_ratio.toFixed(2) + ':1';
+                card.querySelector('.position-value').textContent = s.position_size;
+            });
+            countdown = 30;
+        }
+        // Poll the JSON endpoint and patch cards in place; a full page
+        // reload is only needed for the manual force-refresh button
+        function pollSignals() {
+            fetch('/api/signals')
+                .then(function(r) { return r.json(); })
+                .then(updateCards)
+                .catch(function() {});
+        }
+        setInterval(updateCountdown, 1000);
+        setInterval(pollSignals, 30000);
+    </script>
+</body>
+</html>
+'''
+
+# Compile the template once at import time; render_template_string would
+# re-parse and re-compile the source on every request. auto_reload off so
+# the environment never stats for template changes mid-flight.
+app.jinja_env.auto_reload = False
+_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
+@app.after_request
+def _cache_static(response):
+    """Static assets are version-busted via ?v=N, so cache them forever"""
+    if request.path.startswith('/static/'):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+@app.route('/api/signals')
+def api_signals():
+    """Signals as JSON, served from the per-generation serialized payload"""
+    response = app.response_class(analyzer.get_signals_json(), mimetype='application/json')
+    # Let browsers and intermediaries reuse the 30s snapshot
+    response.headers['Cache-Control'] = 'max-age=15, stale-while-revalidate=30'
+    return response
+
+
+@app.route('/')
+def index():
+    """Main dashboard"""
+    try:
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        if refresh:
+            analyzer.force_refresh_all_data()
+
+        # The page content only changes when the price cache turns over, so
+        # a generation-based ETag lets clients skip the body entirely
+        etag = f'"signals-{analyzer.cache_generation}"'
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+
+        signals = analyzer.get_cached_signals()
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _TEMPLATE.render(signals=signals, current_time=current_time), {
+            'ETag': etag,
+            'Cache-Control': 'public, max-age=30'
+        }
+        
+    except Exception as e:
+        logging.error(f"Error in main route: {e}")
+        return f"<h1>Error loading signals</h1><p>{e}</p>", 500
+
+
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5000))
+    try:
+        # Production-grade threaded server; the Werkzeug dev server is
+        # single-threaded and falls over under concurrent auto-refreshes
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=port, threads=16)
+    except ImportError:
+        app.run(host='0.0.0.0', port=port, debug=False, threaded=True)